@@ -6,7 +6,7 @@ from typing import List
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Allergy:
     """Represents an allergy with associated unsafe ingredients"""
     
@@ -42,12 +42,17 @@ class Allergy:
         ingredient_lower = ingredient_name.lower()
         
         for avoid in self.ingredients_to_avoid:
-            if avoid.lower() in ingredient_lower or ingredient_lower in avoid.lower():
+            avoid_lower = avoid.lower()
+            if avoid_lower in ingredient_lower or ingredient_lower in avoid_lower:
                 return False
         
+        if hasattr(ingredient, 'has_allergen'):
+            return not ingredient.has_allergen(self.allergen_name)
+        
         if hasattr(ingredient, 'allergens'):
+            allergen_lower = self.allergen_name.lower()
             for allergen in ingredient.allergens:
-                if allergen.lower() == self.allergen_name.lower():
+                if allergen.lower() == allergen_lower:
                     return False
         
         return True
@@ -5,7 +5,23 @@ Budget constraint model for recipe recommendation system
 from dataclasses import dataclass
 
 
-@dataclass
+# Cost range (min, max) for each preferred range
+_COST_RANGES = {
+    'low_cost': (0.0, 15.0),
+    'moderate': (10.0, 30.0),
+    'premium': (25.0, float('inf'))
+}
+
+# Recipe budget labels accepted for each preferred range
+_ACCEPTABLE_BUDGETS = {
+    'budget': frozenset({'budget'}),
+    'moderate': frozenset({'budget', 'moderate'}),
+    'premium': frozenset({'moderate', 'premium'})
+}
+_ALL_BUDGETS = frozenset({'budget', 'moderate', 'premium'})
+
+
+@dataclass(slots=True)
 class BudgetConstraint:
     """Represents budget constraints for recipe selection"""
     
@@ -17,12 +33,7 @@ class BudgetConstraint:
     # Set min and max cost based on preferred range
     def __post_init__(self):
         if self.max_cost == float('inf') and self.min_cost == 0.0:
-            ranges = {
-                'low_cost': (0.0, 15.0),
-                'moderate': (10.0, 30.0),
-                'premium': (25.0, float('inf'))
-            }
-            self.min_cost, self.max_cost = ranges.get(self.preferred_range.lower(), (0.0, float('inf')))
+            self.min_cost, self.max_cost = _COST_RANGES.get(self.preferred_range.lower(), (0.0, float('inf')))
     
     # Check if a recipe is affordable
     def can_afford(self, recipe) -> bool:
@@ -47,14 +58,8 @@ class BudgetConstraint:
         budget_value = recipe_budget.value if hasattr(recipe_budget, 'value') else str(recipe_budget)
         budget_lower = budget_value.lower()
         
-        acceptable = {
-            'budget': ['budget'],
-            'moderate': ['budget', 'moderate'],
-            'premium': ['moderate', 'premium']
-        }
-        
         preferred = self.preferred_range.lower()
-        return budget_lower in acceptable.get(preferred, ['budget', 'moderate', 'premium'])
+        return budget_lower in _ACCEPTABLE_BUDGETS.get(preferred, _ALL_BUDGETS)
     
     # Get a string describing the cost range
     def get_cost_range_description(self) -> str:
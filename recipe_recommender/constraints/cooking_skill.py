@@ -6,7 +6,18 @@ from typing import List
 from dataclasses import dataclass, field
 
 
-@dataclass
+# Ordinal rank for every skill/complexity label, built once instead of per call
+_SKILL_RANK = {
+    'easy': 1,
+    'beginner': 1,
+    'medium': 2,
+    'intermediate': 2,
+    'experienced': 3,
+    'advanced': 3,
+}
+
+
+@dataclass(slots=True)
 class CookingSkill:
     """Represents a user's cooking skill level and experience"""
     
@@ -33,9 +44,9 @@ class CookingSkill:
         techniques = []
         level_lower = self.level.lower()
         
-        if level_lower in ['beginner', 'intermediate', 'advanced']:
+        if level_lower in {'beginner', 'intermediate', 'advanced'}:
             techniques.extend(all_techniques['beginner'])
-        if level_lower in ['intermediate', 'advanced']:
+        if level_lower in {'intermediate', 'advanced'}:
             techniques.extend(all_techniques['intermediate'])
         if level_lower == 'advanced':
             techniques.extend(all_techniques['advanced'])
@@ -49,26 +60,12 @@ class CookingSkill:
         else:
             recipe_complexity = recipe_or_complexity
         
-        complexity_map = {
-            'easy': 'beginner',
-            'medium': 'intermediate',
-            'experienced': 'advanced',
-            'beginner': 'beginner',
-            'intermediate': 'intermediate',
-            'advanced': 'advanced'
-        }
-        
-        normalized_complexity = complexity_map.get(recipe_complexity.lower(), recipe_complexity.lower())
-        normalized_level = complexity_map.get(self.level.lower(), self.level.lower())
-        
-        skill_order = ['beginner', 'intermediate', 'advanced']
+        recipe_rank = _SKILL_RANK.get(recipe_complexity.lower())
+        user_rank = _SKILL_RANK.get(self.level.lower())
         
-        try:
-            user_level_idx = skill_order.index(normalized_level)
-            recipe_level_idx = skill_order.index(normalized_complexity)
-            return user_level_idx >= recipe_level_idx
-        except ValueError:
+        if recipe_rank is None or user_rank is None:
             return True
+        return user_rank >= recipe_rank
     
     # Check if user can perform a technique
     def can_perform_technique(self, technique: str) -> bool:
@@ -78,7 +75,8 @@ class CookingSkill:
     
     # Check if user has learned a recipe
     def has_learned(self, recipe_name: str) -> bool:
-        return recipe_name.lower() in [r.lower() for r in self.learned_recipes]
+        recipe_name_lower = recipe_name.lower()
+        return any(r.lower() == recipe_name_lower for r in self.learned_recipes)
     
     # Get numeric skill level
     def get_skill_level_number(self) -> int:
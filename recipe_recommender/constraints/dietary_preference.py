@@ -6,7 +6,15 @@ from typing import List
 from dataclasses import dataclass, field
 
 
-@dataclass
+# Recipe diets each restrictive user diet accepts; other diets accept everything
+_COMPATIBLE_DIETS = {
+    'vegan': frozenset({'vegan'}),
+    'vegetarian': frozenset({'vegan', 'vegetarian'}),
+    'pescatarian': frozenset({'vegan', 'vegetarian', 'pescatarian'}),
+}
+
+
+@dataclass(slots=True)
 class DietaryPreference:
     """Represents dietary preferences and restrictions"""
     
@@ -47,16 +55,10 @@ class DietaryPreference:
         else:
             recipe_diet_str = str(recipe_diet).lower()
         
-        user_diet = self.type.lower()
-        
-        if user_diet == 'vegan':
-            return recipe_diet_str == 'vegan'
-        elif user_diet == 'vegetarian':
-            return recipe_diet_str in ['vegan', 'vegetarian']
-        elif user_diet == 'pescatarian':
-            return recipe_diet_str in ['vegan', 'vegetarian', 'pescatarian']
-        else:
+        allowed = _COMPATIBLE_DIETS.get(self.type.lower())
+        if allowed is None:
             return True
+        return recipe_diet_str in allowed
     
     # Check if user prefers a cuisine
     def prefers_cuisine(self, cuisine: str) -> bool:
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthGoal:
     """Represents a health or nutritional goal"""
     
@@ -45,7 +45,7 @@ class HealthGoal:
             threshold = self.target_value if self.target_value else 600.0
             return hasattr(nutritional_info, 'is_low_sodium') and nutritional_info.is_low_sodium(threshold)
         
-        elif goal_lower in ['low-sugar', 'low-sugars']:
+        elif goal_lower in {'low-sugar', 'low-sugars'}:
             if hasattr(nutritional_info, 'sugar'):
                 threshold = self.target_value if self.target_value else 10.0
                 return nutritional_info.sugar < threshold
@@ -6,7 +6,7 @@ from typing import List
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Kitchen:
     """Represents a kitchen with available equipment and resources"""
     
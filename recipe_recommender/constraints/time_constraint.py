@@ -5,7 +5,26 @@ Time constraint model for recipe recommendation system
 from dataclasses import dataclass
 
 
-@dataclass
+# Minutes assumed for each cooking time label, checked in order
+_COOKING_TIME_MINUTES = (
+    ('less than 15', 10),
+    ('less than 15 minutes', 10),
+    ('15 to 45', 30),
+    ('15 to 45 minutes', 30),
+    ('more than 45', 60),
+    ('more than 45 minutes', 60),
+)
+
+
+# Resolve a cooking time label to minutes
+def _cooking_time_to_minutes(cooking_time_str: str) -> int:
+    for key, minutes in _COOKING_TIME_MINUTES:
+        if key in cooking_time_str:
+            return minutes
+    return 0
+
+
+@dataclass(slots=True)
 class TimeConstraint:
     """Represents time constraints for recipe preparation"""
     
@@ -41,19 +60,7 @@ class TimeConstraint:
             else:
                 cooking_time_str = str(cooking_time).lower()
             
-            time_map = {
-                'less than 15': 10,
-                'less than 15 minutes': 10,
-                '15 to 45': 30,
-                '15 to 45 minutes': 30,
-                'more than 45': 60,
-                'more than 45 minutes': 60
-            }
-            
-            for key, minutes in time_map.items():
-                if key in cooking_time_str:
-                    total_time += minutes
-                    break
+            total_time += _cooking_time_to_minutes(cooking_time_str)
         
         elif hasattr(recipe, 'cook_time') and recipe.cook_time:
             total_time += recipe.cook_time
@@ -6,7 +6,10 @@ from typing import List, Optional, Dict
 from dataclasses import dataclass, field
 
 
-@dataclass
+_SKILL_LEVELS = {'beginner': 1, 'intermediate': 2, 'advanced': 3}
+
+
+@dataclass(slots=True)
 class User:
     """Represents a user with dietary preferences and cooking profile"""
     
@@ -28,25 +31,28 @@ class User:
     serving_size: int = 2
     
     def has_dietary_restriction(self, restriction: str) -> bool:
-        return restriction.lower() in [r.lower() for r in self.dietary_restrictions]
+        restriction_lower = restriction.lower()
+        return any(r.lower() == restriction_lower for r in self.dietary_restrictions)
     
     # Checks if the user is allergic to a specific ingredient
     def is_allergic_to(self, ingredient: str) -> bool:
-        return ingredient.lower() in [a.lower() for a in self.allergies]
+        ingredient_lower = ingredient.lower()
+        return any(a.lower() == ingredient_lower for a in self.allergies)
     
     # Checks if the user has a specific preference (e.g., "likes spicy food")
     def dislikes_ingredient(self, ingredient: str) -> bool:
-        return ingredient.lower() in [i.lower() for i in self.disliked_ingredients]
+        ingredient_lower = ingredient.lower()
+        return any(i.lower() == ingredient_lower for i in self.disliked_ingredients)
     
     # Checks if the user has a specific preference (e.g., "likes spicy food")
     def has_equipment(self, equipment: str) -> bool:
-        return equipment.lower() in [e.lower() for e in self.available_equipment]
+        equipment_lower = equipment.lower()
+        return any(e.lower() == equipment_lower for e in self.available_equipment)
     
     # Checks if the user can cook recipes of a certain complexity level
     def can_cook_complexity(self, complexity: str) -> bool:
-        skill_levels = {'beginner': 1, 'intermediate': 2, 'advanced': 3}
-        user_level = skill_levels.get(self.skill_level.lower(), 1)
-        required_level = skill_levels.get(complexity.lower(), 1)
+        user_level = _SKILL_LEVELS.get(self.skill_level.lower(), 1)
+        required_level = _SKILL_LEVELS.get(complexity.lower(), 1)
         return user_level >= required_level
     
     #  Checks if a recipe fits within the user's cooking time constraint
@@ -59,4 +65,5 @@ class User:
     def prefers_cuisine(self, cuisine: str) -> bool:
         if not self.cuisine_preferences:
             return True
-        return cuisine.lower() in [c.lower() for c in self.cuisine_preferences]
+        cuisine_lower = cuisine.lower()
+        return any(c.lower() == cuisine_lower for c in self.cuisine_preferences)
@@ -6,14 +6,14 @@ from dataclasses import dataclass
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Equipment:
     """Represents kitchen equipment needed for cooking"""
     name: str
     category: Optional[str] = None
     alternatives: Optional[List[str]] = None
     
-    # Indicates if this equipment is essential for the recipe
+    # Default to no alternatives (frozen, so assign through object)
     def __post_init__(self):
         if self.alternatives is None:
-            self.alternatives = []
+            object.__setattr__(self, 'alternatives', [])
@@ -7,7 +7,7 @@ from typing import List, Dict
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Ingredient:
     """Represents an ingredient in a recipe"""
     
@@ -41,11 +41,13 @@ class Ingredient:
     
     # Check if ingredient has a specific allergen
     def has_allergen(self, allergen: str) -> bool:
-        return allergen.lower() in [a.lower() for a in self.allergens]
+        allergen_lower = allergen.lower()
+        return any(a.lower() == allergen_lower for a in self.allergens)
     
     # Check if ingredient fits a diet
     def is_suitable_for_diet(self, diet: str) -> bool:
-        return diet.lower() in [d.lower() for d in self.dietary_flags]
+        diet_lower = diet.lower()
+        return any(d.lower() == diet_lower for d in self.dietary_flags)
     
     # Get substitute ratio for another ingredient
     def get_substitute(self, substitute_name: str) -> float:
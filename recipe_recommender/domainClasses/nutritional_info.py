@@ -7,7 +7,7 @@ from typing import Dict
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NutritionalInfo:
     """Represents nutritional information for a recipe"""
     
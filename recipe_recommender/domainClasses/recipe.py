@@ -7,7 +7,7 @@ from typing import List, Optional, Dict
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Recipe:
     """Represents a complete cooking recipe"""
     
@@ -66,11 +66,13 @@ class Recipe:
     # Check if recipe has any of the given ingredients
     def has_ingredient(self, *ingredient_names: str) -> bool:
         """Check if recipe contains any of the specified ingredients"""
+        if not self.ingredients:
+            return False
+        # Lowercase the names once per call, then one substring scan per target; names never contain newlines
+        names = '\n'.join((ing.name if hasattr(ing, 'name') else str(ing)).lower() for ing in self.ingredients)
         for target_name in ingredient_names:
-            for ing in self.ingredients:
-                ing_name = ing.name if hasattr(ing, 'name') else str(ing)
-                if target_name.lower() in ing_name.lower():
-                    return True
+            if target_name.lower() in names:
+                return True
         return False
     
     # Check if recipe needs specific equipment
@@ -1,10 +1,64 @@
 """Forward-chaining inference engine for recipe recommendation"""
 
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Callable
+from enum import Enum
+import copy
+from functools import lru_cache
+from operator import attrgetter, eq, ne, gt, lt, ge, le
 import yaml
 import json
 from pathlib import Path
 from .rule import Rule
+from .knowledge_base import YAML_LOADER
+
+
+def _always(context) -> bool:
+    return True
+
+
+def _never(actual, expected) -> bool:
+    return False
+
+
+def _all_of(checks: List[Callable[[Dict[str, Any]], bool]]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    # Combine checks with 'and'; None when there is nothing to check
+    if not checks:
+        return None
+    
+    def match_all(context):
+        for check in checks:
+            if not check(context):
+                return False
+        return True
+    return match_all
+
+
+# Parse a knowledge base file once per version (mtime); callers get a shared dict and must copy it
+@lru_cache(maxsize=8)
+def _parse_knowledge_base(kb_path: str, mtime_ns: int) -> Dict[str, Any]:
+    path = Path(kb_path)
+    
+    with open(path, 'r') as f:
+        if path.suffix in {'.yaml', '.yml'}:
+            return yaml.load(f, Loader=YAML_LOADER)
+        elif path.suffix == '.json':
+            return json.load(f)
+        else:
+            raise ValueError(f"Unsupported file format: {path.suffix}")
+
+
+# Condition operators from the knowledge base; unknown operators never match
+_COMPARATORS = {
+    '==': eq,
+    '!=': ne,
+    '>': gt,
+    '<': lt,
+    '>=': ge,
+    '<=': le,
+    'in': lambda actual, expected: actual in expected if isinstance(expected, (list, tuple)) else False,
+    'not_in': lambda actual, expected: actual not in expected if isinstance(expected, (list, tuple)) else True,
+    'contains': lambda actual, expected: expected in actual if hasattr(actual, '__contains__') else False,
+}
 
 
 class InferenceEngine:
@@ -28,13 +82,8 @@ class InferenceEngine:
         if not path.exists():
             raise FileNotFoundError(f"Knowledge base file not found: {kb_path}")
         
-        with open(path, 'r') as f:
-            if path.suffix in ['.yaml', '.yml']:
-                kb_data = yaml.safe_load(f)
-            elif path.suffix == '.json':
-                kb_data = json.load(f)
-            else:
-                raise ValueError(f"Unsupported file format: {path.suffix}")
+        # Rules keep references to their condition and action dicts, so give each engine its own copy
+        kb_data = copy.deepcopy(_parse_knowledge_base(str(path.resolve()), path.stat().st_mtime_ns))
         
         for rule_data in kb_data.get('rules', []):
             rule = Rule(
@@ -48,7 +97,7 @@ class InferenceEngine:
             )
             self.rules.append(rule)
         
-        self.rules.sort(key=lambda r: r.priority, reverse=True)
+        self.rules.sort(key=attrgetter('priority'), reverse=True)
         
     def assert_fact(self, fact: str):
         # Add a fact to working memory
@@ -85,33 +134,42 @@ class InferenceEngine:
     
     def evaluate_condition(self, condition: Dict[str, Any], context: Dict[str, Any]) -> bool:
         # Check one condition
+        return self._compile_condition(condition)(context)
+    
+    def _compile_condition(self, condition: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+        # Turn one condition into a check function, so the condition dict is only read once
         cond_type = condition.get('type', 'attribute')
         
         # Check if it's a fact-based condition (true forward-chaining)
         if cond_type == 'fact':
-            fact = condition.get('fact', '')
-            operator = condition.get('operator', '==')
+            fact_template = condition.get('fact', '')
+            compare = _COMPARATORS.get(condition.get('operator', '=='), _never)
             expected_value = condition.get('value', True)
-
+            
             # Support fact templates with variables
-            fact = fact.replace('{recipe}', context.get('recipe_id', ''))
-            fact = fact.replace('{user}', context.get('user', {}).name if hasattr(context.get('user', {}), 'name') else 'user')
-
-            actual_value = self.has_fact(fact)
-            return self._compare_values(actual_value, expected_value, operator)
+            if '{recipe}' not in fact_template and '{user}' not in fact_template:
+                def check_fact(context):
+                    return compare(fact_template in self.working_memory, expected_value)
+                return check_fact
+            
+            def check_fact_template(context):
+                fact = fact_template.replace('{recipe}', context.get('recipe_id', ''))
+                fact = fact.replace('{user}', context.get('user', {}).name if hasattr(context.get('user', {}), 'name') else 'user')
+                return compare(fact in self.working_memory, expected_value)
+            return check_fact_template
         
         # Check recipe-specific facts
         elif cond_type == 'recipe_fact':
-            recipe_id = context.get('recipe_id', '')
             fact_name = condition.get('fact_name', '')
             expected_value = condition.get('value')
-            operator = condition.get('operator', '==')
+            compare = _COMPARATORS.get(condition.get('operator', '=='), _never)
             
-            actual_value = self.get_recipe_fact(recipe_id, fact_name)
-            if actual_value is None:
-                return False
-            
-            return self._compare_values(actual_value, expected_value, operator)
+            def check_recipe_fact(context):
+                actual_value = self.recipe_facts.get(context.get('recipe_id', ''), {}).get(fact_name)
+                if actual_value is None:
+                    return False
+                return compare(actual_value, expected_value)
+            return check_recipe_fact
         
         # Original attribute-based evaluation (for initial facts)
         obj_name = condition.get('object', 'recipe')
@@ -119,25 +177,17 @@ class InferenceEngine:
         value = condition.get('value')
         operator = condition.get('operator', '==')
         
-        obj = context.get(obj_name)
-        if obj is None:
-            return False
-        
-        # Handle nested attributes
-        if '.' in attribute:
-            parts = attribute.split('.')
-            attr_value = obj
-            for part in parts:
-                if hasattr(attr_value, part):
-                    attr_value = getattr(attr_value, part)
-                else:
-                    return False
         # Handle method calls
-        elif operator == 'method_call':
+        if '.' not in attribute and operator == 'method_call':
             method_name = condition.get('method')
             args = condition.get('args', [])
-            if hasattr(obj, method_name):
-                method = getattr(obj, method_name)
+            
+            def check_method(context):
+                obj = context.get(obj_name)
+                if obj is None:
+                    return False
+                if not hasattr(obj, method_name):
+                    return False
                 resolved_args = []
                 for arg in args:
                     if isinstance(arg, str) and arg in context:
@@ -149,69 +199,116 @@ class InferenceEngine:
                             resolved_args.append(arg)
                     else:
                         resolved_args.append(arg)
-                return method(*resolved_args)
-            return False
-        else:
-            if not hasattr(obj, attribute):
-                return False
-            attr_value = getattr(obj, attribute)
+                return getattr(obj, method_name)(*resolved_args)
+            return check_method
         
-        from enum import Enum
-        if isinstance(attr_value, Enum):
-            attr_value = attr_value.value
+        # Handle nested attributes
+        attr_path = attribute.split('.')
+        compare = _COMPARATORS.get(operator, _never)
         
         # Resolve value if it's a reference like "recipe.cost" or "user.budget"
-        resolved_value = value
-        if isinstance(value, str) and '.' in value:
-            parts = value.split('.')
-            obj_name = parts[0]
-            attr_path = parts[1:]
-            if obj_name in context:
-                resolved_value = context[obj_name]
-                for attr_name in attr_path:
+        value_ref = value.split('.') if isinstance(value, str) and '.' in value else None
+        
+        def check_attribute(context):
+            obj = context.get(obj_name)
+            if obj is None:
+                return False
+            
+            attr_value = obj
+            for part in attr_path:
+                if not hasattr(attr_value, part):
+                    return False
+                attr_value = getattr(attr_value, part)
+            
+            if isinstance(attr_value, Enum):
+                attr_value = attr_value.value
+            
+            resolved_value = value
+            if value_ref is not None and value_ref[0] in context:
+                resolved_value = context[value_ref[0]]
+                for attr_name in value_ref[1:]:
                     if hasattr(resolved_value, attr_name):
                         resolved_value = getattr(resolved_value, attr_name)
                     else:
                         resolved_value = value
                         break
-        
-        return self._compare_values(attr_value, resolved_value, operator)
+            
+            return compare(attr_value, resolved_value)
+        return check_attribute
     
     def _compare_values(self, actual, expected, operator: str) -> bool:
         # Compare values
-        if operator == '==':
-            return actual == expected
-        elif operator == '!=':
-            return actual != expected
-        elif operator == '>':
-            return actual > expected
-        elif operator == '<':
-            return actual < expected
-        elif operator == '>=':
-            return actual >= expected
-        elif operator == '<=':
-            return actual <= expected
-        elif operator == 'in':
-            return actual in expected if isinstance(expected, (list, tuple)) else False
-        elif operator == 'not_in':
-            return actual not in expected if isinstance(expected, (list, tuple)) else True
-        elif operator == 'contains':
-            return expected in actual if hasattr(actual, '__contains__') else False
-        return False
+        return _COMPARATORS.get(operator, _never)(actual, expected)
     
     def evaluate_conditions(self, conditions: List[Dict[str, Any]], context: Dict[str, Any]) -> bool:
         # Check all conditions for a rule
+        return self._compile_conditions(conditions)(context)
+    
+    def _compile_conditions(self, conditions: List[Dict[str, Any]]) -> Callable[[Dict[str, Any]], bool]:
+        # Combine the checks for a rule's conditions into a single function
         if not conditions:
-            return True
+            return _always
         
         logic = conditions[0].get('logic', 'and') if isinstance(conditions[0], dict) else 'and'
+        if logic not in {'and', 'or'}:
+            return _always
+        
+        checks = [self._compile_condition(cond) for cond in conditions]
         
         if logic == 'and':
-            return all(self.evaluate_condition(cond, context) for cond in conditions)
-        elif logic == 'or':
-            return any(self.evaluate_condition(cond, context) for cond in conditions)
+            return _all_of(checks)
         
-        return True
+        def match_any(context):
+            for check in checks:
+                if check(context):
+                    return True
+            return False
+        return match_any
+    
+    def _compile_rule(self, conditions: List[Dict[str, Any]], recipe_count: int) -> tuple:
+        # Compile an 'and' rule for one forward_chain run as (guard, match):
+        # - guard: plain working-memory facts, the same for every recipe, checked once per pass
+        # - match(context, index): the other conditions in declared order, so an earlier condition
+        #   still stops later ones from running. Runs of recipe/user attribute and method conditions,
+        #   which inference never changes, are remembered per recipe after their first check.
+        # 'or' rules are checked in full, with no guard.
+        if not conditions or not isinstance(conditions[0], dict) or conditions[0].get('logic', 'and') != 'and':
+            matches = self._compile_conditions(conditions)
+            
+            def match_full(context, index):
+                return matches(context)
+            return None, match_full
+        
+        guard, steps, fixed_run = [], [], []
+        for cond in conditions:
+            cond_type = cond.get('type', 'attribute')
+            if cond_type in {'fact', 'recipe_fact'}:
+                fact = cond.get('fact', '')
+                if cond_type == 'fact' and '{recipe}' not in fact and '{user}' not in fact:
+                    guard.append(self._compile_condition(cond))
+                    continue
+                if fixed_run:
+                    steps.append((_all_of(fixed_run), [None] * recipe_count))
+                    fixed_run = []
+                steps.append((self._compile_condition(cond), None))
+            else:
+                fixed_run.append(self._compile_condition(cond))
+        if fixed_run:
+            steps.append((_all_of(fixed_run), [None] * recipe_count))
+        
+        def match_steps(context, index):
+            for check, results in steps:
+                if results is None:
+                    if not check(context):
+                        return False
+                    continue
+                ok = results[index]
+                if ok is None:
+                    ok = results[index] = check(context)
+                if not ok:
+                    return False
+            return True
+        return _all_of(guard), match_steps
     
     def forward_chain(self, person: Any, kitchen: Any, recipes: List[Any], max_iterations: int = 20) -> List[Any]:
         # Run forward-chaining inference
@@ -223,6 +320,21 @@ class InferenceEngine:
         # Step 1: Assert initial facts from domain objects
         self._load_initial_facts(person, kitchen, recipes)
         
+        # Compile each rule's conditions once for this run
+        rule_matchers = [(rule, *self._compile_rule(rule.conditions, len(recipes))) for rule in self.rules]
+        
+        # Build context for each recipe once; rules only read from it
+        contexts = [
+            {
+                'user': person,
+                'person': person,
+                'kitchen': kitchen,
+                'recipe': recipe,
+                'recipe_id': recipe.name  # Use name as unique ID
+            }
+            for recipe in recipes
+        ]
+        
         # Step 2: Forward-chaining loop (fire rules until fixed point)
         iteration = 0
         new_facts_derived = True
@@ -232,20 +344,17 @@ class InferenceEngine:
             iteration += 1
             
             # Try to fire each rule
-            for rule in self.rules:
-                # Build context for each recipe
-                for recipe in recipes:
-                    recipe_id = recipe.name  # Use name as unique ID
-                    context = {
-                        'user': person,
-                        'person': person,
-                        'kitchen': kitchen,
-                        'recipe': recipe,
-                        'recipe_id': recipe_id
-                    }
+            for rule, guard, matches in rule_matchers:
+                # Working memory does not change while no recipe matches, so a failed guard skips the rule
+                if guard is not None and not guard({}):
+                    continue
+                
+                for index, context in enumerate(contexts):
+                    recipe = context['recipe']
+                    recipe_id = context['recipe_id']
                     
                     # Check if rule conditions are satisfied
-                    if self.evaluate_conditions(rule.conditions, context):
+                    if matches(context, index):
                         # Fire rule to assert new facts
                         facts_changed = self.execute_forward_action(rule, recipe, context, recipe_id)
                         
@@ -262,6 +371,10 @@ class InferenceEngine:
                                 'recipe': recipe_id,
                                 'description': rule.description
                             })
+                            
+                            # The action may have changed working memory; stop once the guard fails
+                            if guard is not None and not guard({}):
+                                break
         
         # Step 3: Extract recommendations from final facts
         return self.get_recommended_recipes(recipes)
@@ -431,7 +544,7 @@ class InferenceEngine:
             if suitable and affordable and can_prepare and skill_ok:
                 recommended.append(recipe)
         
-        recommended.sort(key=lambda r: r.recommendation_score, reverse=True)
+        recommended.sort(key=attrgetter('recommendation_score'), reverse=True)
         
         return recommended
     
@@ -7,6 +7,9 @@ import yaml
 import json
 from pathlib import Path
 
+# Use libyaml's C loader when PyYAML was built with it; shared by all YAML loading in the app
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class KnowledgeBase:
     """Manages the knowledge base for the recipe recommendation system, including rules and metadata"""
@@ -27,8 +30,8 @@ class KnowledgeBase:
             raise FileNotFoundError(f"Knowledge base file not found: {kb_path}")
         
         with open(path, 'r') as f:
-            if path.suffix in ['.yaml', '.yml']:
-                data = yaml.safe_load(f)
+            if path.suffix in {'.yaml', '.yml'}:
+                data = yaml.load(f, Loader=YAML_LOADER)
             elif path.suffix == '.json':
                 data = json.load(f)
             else:
@@ -47,7 +50,7 @@ class KnowledgeBase:
         }
         
         with open(path, 'w') as f:
-            if path.suffix in ['.yaml', '.yml']:
+            if path.suffix in {'.yaml', '.yml'}:
                 yaml.dump(data, f, default_flow_style=False)
             elif path.suffix == '.json':
                 json.dump(data, f, indent=2)
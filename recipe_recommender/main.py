@@ -7,15 +7,23 @@ import streamlit as st
 from pathlib import Path
 import sys
 
-sys.path.insert(0, str(Path(__file__).parent))
+APP_DIR = Path(__file__).parent
+
+# Streamlit re-executes this script on every rerun; only add the app directory once
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
 
 from constraints.user import User
 from domainClasses.recipe import Recipe
 from domainClasses.ingredient import Ingredient
 from domainClasses.nutritional_info import NutritionalInfo
 from inference.inference_engine import InferenceEngine
+from inference.knowledge_base import YAML_LOADER
 import yaml
 
+KB_PATH = APP_DIR / 'inference' / 'knowledge_base.yaml'
+RECIPES_PATH = APP_DIR / 'data' / 'recipes.yaml'
+
 st.set_page_config(
     page_title="Recipe Recommender - Forward-Chaining Inference",
     page_icon="🍳",
@@ -209,8 +217,8 @@ def answer_question(answer, custom_value=None):
         if answer:
             st.session_state.answers[category].append(value)
         # For gate questions, store boolean
-        if category in ['has_allergies', 'has_special_diet', 'has_restrictions', 'has_equipment', 'has_health_goals',
-                        'has_cuisine_pref', 'has_meal_pref', 'has_method_pref', 'has_lifestyle_pref']:
+        if category in {'has_allergies', 'has_special_diet', 'has_restrictions', 'has_equipment', 'has_health_goals',
+                        'has_cuisine_pref', 'has_meal_pref', 'has_method_pref', 'has_lifestyle_pref'}:
             st.session_state.answers[category] = answer
     
     # Find next question that should be asked
@@ -262,11 +270,16 @@ def reset_quiz():
 
 
 def load_all_recipes():
-    # Load recipes from YAML file
-    recipes_file = Path(__file__).parent / 'data' / 'recipes.yaml'
-    
+    # Load recipes from YAML file (cached until the file changes)
+    return _build_recipes(str(RECIPES_PATH), RECIPES_PATH.stat().st_mtime_ns)
+
+
+@st.cache_data(show_spinner=False)
+def _build_recipes(recipes_file, mtime_ns):
+    # Parse recipes once per file version; st.cache_data gives every caller its own copy,
+    # so forward_chain can update the returned recipes freely
     with open(recipes_file, 'r') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=YAML_LOADER)
     
     recipes = []
     for recipe_data in data.get('recipes', []):
@@ -324,10 +337,10 @@ def get_recommendation_reasons(recipe, user, working_memory):
         if recipe.diet == 'vegan':
             reasons.append("✅ **Vegan-friendly** - matches your diet preference")
     elif 'vegetarian' in user_diet:
-        if recipe.diet in ['vegan', 'vegetarian']:
+        if recipe.diet in {'vegan', 'vegetarian'}:
             reasons.append("✅ **Vegetarian-friendly** - matches your diet preference")
     elif 'pescatarian' in user_diet:
-        if recipe.diet in ['vegan', 'vegetarian', 'pescatarian']:
+        if recipe.diet in {'vegan', 'vegetarian', 'pescatarian'}:
             reasons.append("✅ **Pescatarian-friendly** - matches your diet preference")
     
     # Check dietary restrictions
@@ -361,7 +374,7 @@ def get_recommendation_reasons(recipe, user, working_memory):
     
     # Check skill level
     user_skill = st.session_state.answers.get('skill', ['beginner'])[0]
-    if recipe.skill.lower() == user_skill or recipe.skill in ['beginner', 'easy']:
+    if recipe.skill.lower() == user_skill or recipe.skill in {'beginner', 'easy'}:
         reasons.append(f"✅ **Skill-appropriate** - matches your {user_skill} level")
     
     # Check budget
@@ -376,7 +389,7 @@ def get_recommendation_reasons(recipe, user, working_memory):
         # Check if user has necessary equipment
         compatible = True
         for req_eq in recipe_equipment:
-            if req_eq not in user_equipment and req_eq not in ['bowl', 'spoon', 'knife']:  # basic items assumed
+            if req_eq not in user_equipment and req_eq not in {'bowl', 'spoon', 'knife'}:  # basic items assumed
                 compatible = False
                 break
         if compatible and recipe_equipment:
@@ -674,8 +687,7 @@ elif st.session_state.inference_complete:
     all_recipes = load_all_recipes()
     
     # Run inference engine
-    kb_path = Path(__file__).parent / 'inference' / 'knowledge_base.yaml'
-    engine = InferenceEngine(str(kb_path))
+    engine = InferenceEngine(str(KB_PATH))
     
     with st.spinner("🧠 Running inference engine..."):
         recommended = engine.forward_chain(user, user, all_recipes)